@@ -8,7 +8,7 @@ from datetime import datetime
 import logging
 
 from app.models.message import AgentRole
-from app.websocket.manager import notify_agent_message
+from app.websocket.manager import notify_agent_message, agent_message_payload
 
 logger = logging.getLogger(__name__)
 
@@ -53,31 +53,25 @@ class BaseAgent(ABC):
         logger.info(f"{self.name} sending message for task {task_id}: {message[:100]}...")
         
         # Save message to database
-        from app.database import SessionLocal
+        from app.database import AsyncSessionLocal
         from app.models.message import Message
         
-        db = SessionLocal()
-        try:
-            db_message = Message(
-                task_id=task_id,
-                agent_role=self.role,
-                content=message
-            )
-            db.add(db_message)
-            db.commit()
-            logger.info(f"Message saved to database for task {task_id}")
-        except Exception as e:
-            logger.error(f"Failed to save message to database: {str(e)}")
-            db.rollback()
-        finally:
-            db.close()
+        async with AsyncSessionLocal() as db:
+            try:
+                db_message = Message(
+                    task_id=task_id,
+                    agent_role=self.role,
+                    content=message
+                )
+                db.add(db_message)
+                await db.commit()
+                logger.info(f"Message saved to database for task {task_id}")
+            except Exception as e:
+                logger.error(f"Failed to save message to database: {str(e)}")
+                await db.rollback()
         
         # Notify via WebSocket for real-time updates
-        await notify_agent_message(task_id, {
-            "agent_role": self.role.value,
-            "content": message,
-            "timestamp": datetime.utcnow().isoformat()
-        })
+        await notify_agent_message(task_id, agent_message_payload(self.role.value, message))
         
         # Return message data for storage
         return {
@@ -20,7 +20,7 @@ from app.agents.writer import WriterAgent
 from app.agents.analyst import AnalystAgent
 from app.models.message import AgentRole, Message
 from app.models.task import Task, TaskStatus
-from app.websocket.manager import notify_task_started, notify_task_completed, notify_error
+from app.websocket.manager import notify_task_started, notify_task_status, notify_task_completed, notify_error
 from app.config import settings
 
 logger = logging.getLogger(__name__)
@@ -322,7 +322,7 @@ Respond with only the agent name or action."""
         
         Args:
             task: Task to process
-            db_session: Database session for persistence
+            db_session: Async database session for persistence
             
         Returns:
             Final deliverable content
@@ -354,7 +354,8 @@ Respond with only the agent name or action."""
             
             # Update task status
             task.status = TaskStatus.IN_PROGRESS
-            db_session.commit()
+            await db_session.commit()
+            await notify_task_status(task.id, task.status.value)
             
             # Execute workflow
             final_state = await self.workflow.ainvoke(initial_state)
@@ -366,7 +367,8 @@ Respond with only the agent name or action."""
                 # Update task with deliverable
                 task.deliverable = deliverable
                 task.status = TaskStatus.COMPLETED
-                db_session.commit()
+                await db_session.commit()
+                await notify_task_status(task.id, task.status.value)
                 
                 # Notify completion
                 await notify_task_completed(task.id, deliverable)
@@ -377,7 +379,8 @@ Respond with only the agent name or action."""
                 # Handle failure
                 error_msg = final_state.get("error", "Unknown error occurred")
                 task.status = TaskStatus.FAILED
-                db_session.commit()
+                await db_session.commit()
+                await notify_task_status(task.id, task.status.value)
                 
                 await notify_error(task.id, error_msg)
                 
@@ -388,7 +391,8 @@ Respond with only the agent name or action."""
             logger.error(f"Orchestrator error for task {task.id}: {str(e)}")
             
             task.status = TaskStatus.FAILED
-            db_session.commit()
+            await db_session.commit()
+            await notify_task_status(task.id, task.status.value)
             
             await notify_error(task.id, str(e))
             
@@ -403,7 +407,7 @@ Respond with only the agent name or action."""
                 content=content
             )
             self._db_session.add(message)
-            self._db_session.commit()
+            await self._db_session.commit()
         except Exception as e:
             logger.error(f"Error saving message: {str(e)}")
 
@@ -6,7 +6,6 @@ Based on LangGraph latest best practices for multi-agent systems.
 
 import logging
 from typing import Dict, Any, List, TypedDict, Annotated, Literal, Optional
-from datetime import datetime
 import json
 
 from langchain_core.messages import BaseMessage, HumanMessage, AIMessage, SystemMessage
@@ -21,7 +20,7 @@ from app.agents.writer import WriterAgent
 from app.agents.analyst import AnalystAgent
 from app.models.message import AgentRole, Message
 from app.models.task import Task, TaskStatus
-from app.websocket.manager import notify_task_started, notify_task_completed, notify_error, notify_agent_message
+from app.websocket.manager import notify_task_started, notify_task_status, notify_task_completed, notify_error, notify_agent_message, agent_message_payload, flush_agent_messages
 from app.config import settings
 
 logger = logging.getLogger(__name__)
@@ -152,11 +151,11 @@ Which agent should work next? Respond with only: researcher, writer, analyst, fi
             logger.info(f"Supervisor decision for task {state['task_id']}: {next_action}")
             
             # Send notification about agent assignment
-            await notify_agent_message(state['task_id'], {
-                "agent_role": "supervisor",
-                "content": f"Assigning task to {next_action}",
-                "timestamp": datetime.now().isoformat()
-            })
+            await self._notify_progress(
+                state['task_id'],
+                "supervisor",
+                f"Assigning task to {next_action}"
+            )
             
             # Return Command with goto
             if next_action == "end":
@@ -204,11 +203,7 @@ Which agent should work next? Respond with only: researcher, writer, analyst, fi
             }
             
             # Notify that researcher is working
-            await notify_agent_message(state['task_id'], {
-                "agent_role": "researcher",
-                "content": "Starting research on the topic...",
-                "timestamp": datetime.now().isoformat()
-            })
+            await self._notify_progress(state['task_id'], "researcher", "Starting research on the topic...")
             
             result = await self.researcher.process(
                 state["task_id"],
@@ -216,11 +211,12 @@ Which agent should work next? Respond with only: researcher, writer, analyst, fi
             )
             
             # Send research summary
-            await notify_agent_message(state['task_id'], {
-                "agent_role": "researcher",
-                "content": f"Research completed. Found {result.get('sources_found', 0)} sources. Key findings: {result.get('synthesis', '')[:200]}...",
-                "timestamp": datetime.now().isoformat()
-            })
+            await self._notify_progress(
+                state['task_id'],
+                "researcher",
+                f"Research completed. Found {result.get('sources_found', 0)} sources. Key findings: {result.get('synthesis', '')[:200]}...",
+                end_of_turn=True
+            )
             
             # Message already saved by agent's send_message method
             
@@ -265,11 +261,7 @@ Which agent should work next? Respond with only: researcher, writer, analyst, fi
             }
             
             # Notify that writer is working
-            await notify_agent_message(state['task_id'], {
-                "agent_role": "writer",
-                "content": "Drafting content based on research...",
-                "timestamp": datetime.now().isoformat()
-            })
+            await self._notify_progress(state['task_id'], "writer", "Drafting content based on research...")
             
             result = await self.writer.process(
                 state["task_id"],
@@ -277,11 +269,12 @@ Which agent should work next? Respond with only: researcher, writer, analyst, fi
             )
             
             # Send writing update
-            await notify_agent_message(state['task_id'], {
-                "agent_role": "writer",
-                "content": f"Content draft completed. Length: {len(result.get('content', ''))} characters",
-                "timestamp": datetime.now().isoformat()
-            })
+            await self._notify_progress(
+                state['task_id'],
+                "writer",
+                f"Content draft completed. Length: {len(result.get('content', ''))} characters",
+                end_of_turn=True
+            )
             
             # Message already saved by agent's send_message method
             
@@ -326,11 +319,7 @@ Which agent should work next? Respond with only: researcher, writer, analyst, fi
             }
             
             # Notify that analyst is working
-            await notify_agent_message(state['task_id'], {
-                "agent_role": "analyst",
-                "content": "Reviewing and refining content...",
-                "timestamp": datetime.now().isoformat()
-            })
+            await self._notify_progress(state['task_id'], "analyst", "Reviewing and refining content...")
             
             result = await self.analyst.process(
                 state["task_id"],
@@ -338,11 +327,12 @@ Which agent should work next? Respond with only: researcher, writer, analyst, fi
             )
             
             # Send analyst update
-            await notify_agent_message(state['task_id'], {
-                "agent_role": "analyst",
-                "content": "Content reviewed and refined. Final deliverable ready.",
-                "timestamp": datetime.now().isoformat()
-            })
+            await self._notify_progress(
+                state['task_id'],
+                "analyst",
+                "Content reviewed and refined. Final deliverable ready.",
+                end_of_turn=True
+            )
             
             # Message already saved by agent's send_message method
             
@@ -386,11 +376,7 @@ Which agent should work next? Respond with only: researcher, writer, analyst, fi
         logger.info(f"Finalizing task {state['task_id']} with deliverable")
         
         # Send completion notification
-        await notify_agent_message(state['task_id'], {
-            "agent_role": "supervisor",
-            "content": "Task completed successfully!",
-            "timestamp": datetime.now().isoformat()
-        })
+        await self._notify_progress(state['task_id'], "supervisor", "Task completed successfully!")
         
         return {
             "final_deliverable": deliverable,
@@ -408,7 +394,7 @@ Which agent should work next? Respond with only: researcher, writer, analyst, fi
         
         Args:
             task: Task to process
-            db_session: Database session for persistence
+            db_session: Async database session for persistence
             
         Returns:
             Final deliverable content
@@ -440,7 +426,8 @@ Which agent should work next? Respond with only: researcher, writer, analyst, fi
             
             # Update task status
             task.status = TaskStatus.IN_PROGRESS
-            db_session.commit()
+            await db_session.commit()
+            await notify_task_status(task.id, task.status.value)
             
             logger.info(f"Starting workflow for task {task.id}")
             
@@ -454,7 +441,8 @@ Which agent should work next? Respond with only: researcher, writer, analyst, fi
                 # Update task with deliverable
                 task.deliverable = deliverable
                 task.status = TaskStatus.COMPLETED
-                db_session.commit()
+                await db_session.commit()
+                await notify_task_status(task.id, task.status.value)
                 
                 # Notify completion
                 await notify_task_completed(task.id, deliverable)
@@ -465,7 +453,8 @@ Which agent should work next? Respond with only: researcher, writer, analyst, fi
                 # Handle failure
                 error_msg = final_state.get("error", "No deliverable produced")
                 task.status = TaskStatus.FAILED
-                db_session.commit()
+                await db_session.commit()
+                await notify_task_status(task.id, task.status.value)
                 
                 await notify_error(task.id, error_msg)
                 
@@ -476,12 +465,24 @@ Which agent should work next? Respond with only: researcher, writer, analyst, fi
             logger.error(f"Orchestrator error for task {task.id}: {str(e)}")
             
             task.status = TaskStatus.FAILED
-            db_session.commit()
+            await db_session.commit()
+            await notify_task_status(task.id, task.status.value)
             
             await notify_error(task.id, str(e))
             
             return f"Task processing error: {str(e)}"
     
+    async def _notify_progress(self, task_id: str, agent_role: str, content: str, end_of_turn: bool = False):
+        """
+        Send a workflow progress message to task subscribers.
+        
+        With ``end_of_turn`` the agent's batched messages are delivered
+        immediately instead of waiting out the coalescing window.
+        """
+        await notify_agent_message(task_id, agent_message_payload(agent_role, content))
+        if end_of_turn:
+            await flush_agent_messages(task_id)
+    
     async def _save_agent_message(self, task_id: str, agent_role: AgentRole, content: str):
         """Save agent message to database."""
         try:
@@ -492,7 +493,7 @@ Which agent should work next? Respond with only: researcher, writer, analyst, fi
                     content=content
                 )
                 self._db_session.add(message)
-                self._db_session.commit()
+                await self._db_session.commit()
         except Exception as e:
             logger.error(f"Error saving message: {str(e)}")
 
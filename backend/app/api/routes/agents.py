@@ -0,0 +1,37 @@
+"""
+Agent catalog endpoints.
+"""
+
+from fastapi import APIRouter
+from fastapi.responses import Response
+
+from app.schemas.agent import AgentListResponse, AGENT_LIST_RESPONSE
+
+router = APIRouter()
+
+
+@router.get(
+    "/",
+    response_model=AgentListResponse,
+    summary="List Available Agents",
+    description="""
+    Retrieve the agents that collaborate on every task.
+    
+    Returns the role, name, description, and capabilities of the
+    Researcher, Writer, and Analyst agents.
+    """,
+    responses={
+        200: {"description": "Agent catalog retrieved successfully"}
+    }
+)
+async def list_agents():
+    """
+    List the available AI agents.
+    
+    The catalog is fixed, so the pre-serialized payload is returned
+    directly without per-request validation or encoding.
+    
+    Returns:
+        AgentListResponse: Available agents and their capabilities
+    """
+    return Response(content=AGENT_LIST_RESPONSE, media_type="application/json")
@@ -3,15 +3,23 @@ Message and conversation API endpoints with OpenAPI documentation.
 """
 
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from fastapi.responses import Response
+from sqlalchemy import case, func, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database import get_db
 from app.models.message import Message
 from app.models.task import Task
-from app.schemas.message import MessageResponse, MessageListResponse, MessageCreate
+from app.schemas.message import (
+    MessageResponse, MessageListResponse, MessageCreate, MessageStatsResponse,
+    MESSAGE_LIST_ADAPTER
+)
 
 router = APIRouter()
 
+# Non-space whitespace that str.strip() removes but SQL TRIM does not
+BLANK_CHARACTERS = ("\n", "\r", "\t", "\v", "\f")
+
 
 @router.get(
     "/task/{task_id}",
@@ -33,7 +41,7 @@ router = APIRouter()
         404: {"description": "Task not found"}
     }
 )
-async def get_task_messages(task_id: str, db: Session = Depends(get_db)):
+async def get_task_messages(task_id: str, db: AsyncSession = Depends(get_db)):
     """
     Get all messages for a specific task.
     
@@ -48,20 +56,75 @@ async def get_task_messages(task_id: str, db: Session = Depends(get_db)):
         HTTPException: 404 if task not found
     """
     # Verify task exists
-    task = db.query(Task).filter(Task.id == task_id).first()
+    task = await db.get(Task, task_id)
     if not task:
         raise HTTPException(status_code=404, detail="Task not found")
     
     # Get all messages for the task
-    messages = db.query(Message).filter(
-        Message.task_id == task_id
-    ).order_by(Message.created_at.asc()).all()
+    result = await db.execute(
+        select(Message).where(
+            Message.task_id == task_id
+        ).order_by(Message.created_at.asc())
+    )
+    messages = result.scalars().all()
     
-    return MessageListResponse(
-        messages=messages,
+    # Serialize directly, as list_tasks does
+    response = MessageListResponse.model_construct(
+        messages=MESSAGE_LIST_ADAPTER.validate_python(messages, from_attributes=True),
         total=len(messages),
         task_id=task_id
     )
+    return Response(content=response.model_dump_json(), media_type="application/json")
+
+
+@router.get(
+    "/task/{task_id}/stats",
+    response_model=MessageStatsResponse,
+    summary="Get Task Conversation Stats",
+    description="""
+    Count the messages in a task conversation without returning them.
+    
+    Reports the total number of messages and how many have blank content,
+    computed in a single aggregate query.
+    """,
+    responses={
+        200: {"description": "Stats retrieved successfully"},
+        404: {"description": "Task not found"}
+    }
+)
+async def get_task_message_stats(task_id: str, db: AsyncSession = Depends(get_db)):
+    """
+    Get message counts for a specific task.
+    
+    Args:
+        task_id: Unique task identifier
+        db: Database session
+        
+    Returns:
+        MessageStatsResponse: Total and blank message counts
+        
+    Raises:
+        HTTPException: 404 if task not found
+    """
+    # Verify task exists
+    task = await db.get(Task, task_id)
+    if not task:
+        raise HTTPException(status_code=404, detail="Task not found")
+    
+    # SQL TRIM only strips spaces, so drop other whitespace first to match str.strip()
+    stripped = Message.content
+    for char in BLANK_CHARACTERS:
+        stripped = func.replace(stripped, char, "")
+    is_empty = or_(Message.content.is_(None), func.trim(stripped) == "")
+    result = await db.execute(
+        select(
+            func.count(Message.id),
+            func.coalesce(func.sum(case((is_empty, 1), else_=0)), 0)
+        ).where(Message.task_id == task_id)
+    )
+    total, empty = result.one()
+    
+    return MessageStatsResponse(task_id=task_id, total=total, empty=empty)
 
 
 @router.post(
@@ -86,7 +149,7 @@ async def get_task_messages(task_id: str, db: Session = Depends(get_db)):
         400: {"description": "Invalid message data"}
     }
 )
-async def create_message(message: MessageCreate, db: Session = Depends(get_db)):
+async def create_message(message: MessageCreate, db: AsyncSession = Depends(get_db)):
     """
     Add a new message to a task conversation.
     
@@ -101,7 +164,7 @@ async def create_message(message: MessageCreate, db: Session = Depends(get_db)):
         HTTPException: 404 if task not found
     """
     # Verify task exists
-    task = db.query(Task).filter(Task.id == message.task_id).first()
+    task = await db.get(Task, message.task_id)
     if not task:
         raise HTTPException(status_code=404, detail="Task not found")
     
@@ -113,8 +176,8 @@ async def create_message(message: MessageCreate, db: Session = Depends(get_db)):
     )
     
     db.add(db_message)
-    db.commit()
-    db.refresh(db_message)
+    await db.commit()
+    await db.refresh(db_message)
     
     # TODO: Trigger WebSocket notification to connected clients
     
@@ -136,7 +199,7 @@ async def create_message(message: MessageCreate, db: Session = Depends(get_db)):
         404: {"description": "Message not found"}
     }
 )
-async def get_message(message_id: str, db: Session = Depends(get_db)):
+async def get_message(message_id: str, db: AsyncSession = Depends(get_db)):
     """
     Retrieve a specific message by ID.
     
@@ -150,7 +213,7 @@ async def get_message(message_id: str, db: Session = Depends(get_db)):
     Raises:
         HTTPException: 404 if message not found
     """
-    message = db.query(Message).filter(Message.id == message_id).first()
+    message = await db.get(Message, message_id)
     
     if not message:
         raise HTTPException(status_code=404, detail="Message not found")
@@ -4,11 +4,16 @@ Task management API endpoints with comprehensive OpenAPI documentation.
 
 from typing import List
 from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.orm import Session
+from fastapi.responses import Response
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database import get_db
 from app.models.task import Task, TaskStatus
-from app.schemas.task import TaskCreate, TaskResponse, TaskUpdate, TaskListResponse
+from app.schemas.task import (
+    TaskCreate, TaskResponse, TaskUpdate, TaskListResponse, TaskStatusResponse,
+    TASK_LIST_ADAPTER
+)
 
 router = APIRouter()
 
@@ -34,7 +39,7 @@ router = APIRouter()
         422: {"description": "Validation error"}
     }
 )
-async def create_task(task: TaskCreate, db: Session = Depends(get_db)):
+async def create_task(task: TaskCreate, db: AsyncSession = Depends(get_db)):
     """
     Create a new task for AI agent processing.
     
@@ -53,8 +58,8 @@ async def create_task(task: TaskCreate, db: Session = Depends(get_db)):
         )
         
         db.add(db_task)
-        db.commit()
-        db.refresh(db_task)
+        await db.commit()
+        await db.refresh(db_task)
         
         # Trigger agent workflow processing (non-blocking)
         try:
@@ -74,7 +79,7 @@ async def create_task(task: TaskCreate, db: Session = Depends(get_db)):
         return db_task
     
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         import logging
         logger = logging.getLogger(__name__)
         logger.error(f"Failed to create task: {str(e)}")
@@ -103,7 +108,7 @@ async def list_tasks(
     page: int = Query(1, ge=1, description="Page number (starts from 1)"),
     size: int = Query(10, ge=1, le=100, description="Number of tasks per page"),
     status: TaskStatus = Query(None, description="Filter by task status"),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """
     Retrieve a paginated list of tasks.
@@ -118,23 +123,28 @@ async def list_tasks(
         TaskListResponse: Paginated list of tasks with metadata
     """
     try:
-        query = db.query(Task)
+        query = select(Task)
         
         if status:
-            query = query.filter(Task.status == status)
+            query = query.where(Task.status == status)
         
         # Get total count for pagination
-        total = query.count()
+        total = await db.scalar(select(func.count()).select_from(query.subquery()))
         
         # Apply pagination and ordering
-        tasks = query.order_by(Task.created_at.desc()).offset((page - 1) * size).limit(size).all()
+        result = await db.execute(
+            query.order_by(Task.created_at.desc()).offset((page - 1) * size).limit(size)
+        )
+        tasks = result.scalars().all()
         
-        return TaskListResponse(
-            tasks=tasks,
+        # Skip FastAPI's response_model pass; the adapter already validated the rows
+        response = TaskListResponse.model_construct(
+            tasks=TASK_LIST_ADAPTER.validate_python(tasks, from_attributes=True),
             total=total,
             page=page,
             size=size
         )
+        return Response(content=response.model_dump_json(), media_type="application/json")
     except Exception as e:
         import logging
         logger = logging.getLogger(__name__)
@@ -160,7 +170,7 @@ async def list_tasks(
         404: {"description": "Task not found"}
     }
 )
-async def get_task(task_id: str, db: Session = Depends(get_db)):
+async def get_task(task_id: str, db: AsyncSession = Depends(get_db)):
     """
     Retrieve a specific task by ID.
     
@@ -174,7 +184,7 @@ async def get_task(task_id: str, db: Session = Depends(get_db)):
     Raises:
         HTTPException: 404 if task not found
     """
-    task = db.query(Task).filter(Task.id == task_id).first()
+    task = await db.get(Task, task_id)
     
     if not task:
         raise HTTPException(status_code=404, detail="Task not found")
@@ -182,6 +192,43 @@ async def get_task(task_id: str, db: Session = Depends(get_db)):
     return task
 
 
+@router.get(
+    "/{task_id}/status",
+    response_model=TaskStatusResponse,
+    summary="Get Task Status",
+    description="""
+    Retrieve only the processing status of a task.
+    
+    A lightweight alternative to fetching the full task for clients that
+    poll for completion; the deliverable is not loaded or returned.
+    """,
+    responses={
+        200: {"description": "Task status returned"},
+        404: {"description": "Task not found"}
+    }
+)
+async def get_task_status(task_id: str, db: AsyncSession = Depends(get_db)):
+    """
+    Retrieve the status of a specific task.
+    
+    Args:
+        task_id: Unique task identifier
+        db: Database session
+        
+    Returns:
+        TaskStatusResponse: Task ID and current status
+        
+    Raises:
+        HTTPException: 404 if task not found
+    """
+    status = await db.scalar(select(Task.status).where(Task.id == task_id))
+    
+    if status is None:
+        raise HTTPException(status_code=404, detail="Task not found")
+    
+    return TaskStatusResponse(id=task_id, status=status)
+
+
 @router.put(
     "/{task_id}",
     response_model=TaskResponse,
@@ -201,7 +248,7 @@ async def get_task(task_id: str, db: Session = Depends(get_db)):
 async def update_task(
     task_id: str, 
     task_update: TaskUpdate, 
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """
     Update an existing task.
@@ -217,7 +264,7 @@ async def update_task(
     Raises:
         HTTPException: 404 if task not found
     """
-    task = db.query(Task).filter(Task.id == task_id).first()
+    task = await db.get(Task, task_id)
     
     if not task:
         raise HTTPException(status_code=404, detail="Task not found")
@@ -227,8 +274,8 @@ async def update_task(
     for field, value in update_data.items():
         setattr(task, field, value)
     
-    db.commit()
-    db.refresh(task)
+    await db.commit()
+    await db.refresh(task)
     
     return task
 
@@ -248,7 +295,7 @@ async def update_task(
         404: {"description": "Task not found"}
     }
 )
-async def delete_task(task_id: str, db: Session = Depends(get_db)):
+async def delete_task(task_id: str, db: AsyncSession = Depends(get_db)):
     """
     Delete a task and all associated data.
     
@@ -259,12 +306,12 @@ async def delete_task(task_id: str, db: Session = Depends(get_db)):
     Raises:
         HTTPException: 404 if task not found
     """
-    task = db.query(Task).filter(Task.id == task_id).first()
+    task = await db.get(Task, task_id)
     
     if not task:
         raise HTTPException(status_code=404, detail="Task not found")
     
-    db.delete(task)
-    db.commit()
+    await db.delete(task)
+    await db.commit()
     
     return None
\ No newline at end of file
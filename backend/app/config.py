@@ -4,7 +4,7 @@ Configuration management for the AI Digital Workforce backend.
 Uses Pydantic Settings for environment variable management with validation.
 """
 
-from typing import List
+from typing import List, Optional
 from pydantic_settings import BaseSettings
 from pydantic import Field
 
@@ -27,6 +27,22 @@ class Settings(BaseSettings):
         default="sqlite:///./data/database.db",
         description="Database connection URL"
     )
+    db_pool_size: int = Field(
+        default=20,
+        description="Persistent connections kept in the database pool"
+    )
+    db_max_overflow: int = Field(
+        default=10,
+        description="Extra connections allowed beyond the pool size under load"
+    )
+    db_pool_timeout: int = Field(
+        default=30,
+        description="Seconds to wait for a pooled connection before failing"
+    )
+    db_pool_recycle: int = Field(
+        default=3600,
+        description="Seconds after which pooled connections are replaced"
+    )
     
     # API Keys
     openai_api_key: str = Field(
@@ -73,6 +89,10 @@ class Settings(BaseSettings):
         default=60,
         description="WebSocket ping timeout in seconds"
     )
+    redis_url: Optional[str] = Field(
+        default=None,
+        description="Redis URL for sharing WebSocket broadcasts across workers"
+    )
     
     class Config:
         env_file = ".env"
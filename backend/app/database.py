@@ -2,11 +2,17 @@
 Database configuration and session management for SQLAlchemy.
 
 Provides database connection, session management, and table creation utilities.
+The application uses an asyncio engine so database I/O does not block the
+event loop; a synchronous engine is kept for standalone scripts.
 """
 
 import logging
 import os
-from sqlalchemy import create_engine
+from typing import AsyncGenerator
+
+from sqlalchemy import create_engine, inspect
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import StaticPool
 
@@ -14,6 +20,22 @@ from app.config import settings
 
 logger = logging.getLogger(__name__)
 
+# asyncio drivers used by the application engine, keyed by database backend
+ASYNC_DRIVERS = {
+    "sqlite": "sqlite+aiosqlite",
+    "mysql": "mysql+asyncmy",
+}
+
+
+def get_async_database_url(database_url: str) -> str:
+    """Map a database URL onto the asyncio driver for its backend."""
+    url = make_url(database_url)
+    driver = ASYNC_DRIVERS.get(url.get_backend_name())
+    if not driver:
+        return database_url
+    return url.set(drivername=driver).render_as_string(hide_password=False)
+
+
 # Ensure data directory exists for SQLite
 if settings.database_url.startswith("sqlite"):
     db_path = settings.database_url.replace("sqlite:///", "")
@@ -23,7 +45,7 @@ if settings.database_url.startswith("sqlite"):
             os.makedirs(db_dir, exist_ok=True)
             logger.info(f"Created database directory: {db_dir}")
 
-# Create database engine
+# Create database engines
 if settings.database_url.startswith("sqlite"):
     # SQLite specific configuration
     engine = create_engine(
@@ -34,41 +56,82 @@ if settings.database_url.startswith("sqlite"):
         poolclass=StaticPool,  # Use static pool for SQLite
         echo=settings.debug,  # Log SQL queries in debug mode
     )
+    async_engine = create_async_engine(
+        get_async_database_url(settings.database_url),
+        echo=settings.debug,
+    )
 else:
-    # PostgreSQL or other databases
+    # MySQL, PostgreSQL or other databases: reuse pooled connections
+    # instead of reconnecting per session
+    pool_options = {
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+        "pool_timeout": settings.db_pool_timeout,
+        "pool_recycle": settings.db_pool_recycle,  # Stay under MySQL wait_timeout
+        "pool_pre_ping": True,  # Replace connections dropped by the server
+    }
     engine = create_engine(
         settings.database_url,
         echo=settings.debug,
+        **pool_options,
+    )
+    async_engine = create_async_engine(
+        get_async_database_url(settings.database_url),
+        echo=settings.debug,
+        **pool_options,
     )
 
-# Create session factory
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# Session factory for standalone scripts (init_db.py, init_mysql.py)
+SessionLocal = sessionmaker(
+    autocommit=False,
+    autoflush=False,
+    expire_on_commit=False,
+    bind=engine
+)
+
+# Session factory for the application
+AsyncSessionLocal = async_sessionmaker(
+    async_engine,
+    class_=AsyncSession,
+    autoflush=False,
+    expire_on_commit=False,
+)
 
 # Import Base from models.base instead of creating new one
 from app.models.base import Base
 
 
-def get_db():
+async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """
     Dependency to get database session.
     
     Yields:
-        Session: SQLAlchemy database session
+        AsyncSession: SQLAlchemy async database session
     """
-    db = SessionLocal()
-    try:
+    async with AsyncSessionLocal() as db:
         yield db
-    finally:
-        db.close()
 
 
 async def create_tables():
-    """Create all database tables."""
+    """
+    Create all database tables unless the schema is already in place.
+    
+    A single table listing replaces create_all's per-table existence checks
+    on warm starts. Databases managed by Alembic (an ``alembic_version``
+    table is present) are left to migrations.
+    """
     try:
         # Import models to register them with Base
         from app.models import task, message  # noqa: F401
         
-        Base.metadata.create_all(bind=engine)
+        async with async_engine.begin() as conn:
+            existing = await conn.run_sync(
+                lambda sync_conn: set(inspect(sync_conn).get_table_names())
+            )
+            if "alembic_version" in existing or existing.issuperset(Base.metadata.tables):
+                logger.info("Database schema already present, skipping table creation")
+                return
+            await conn.run_sync(Base.metadata.create_all)
         logger.info("Database tables created successfully")
     except Exception as e:
         logger.error(f"Error creating database tables: {e}")
@@ -56,4 +56,43 @@ class AgentListResponse(BaseModel):
                     }
                 ]
             }
-        }
\ No newline at end of file
+        }
+
+# The agent catalog is static, so validate and serialize it once at import
+# time and serve the encoded bytes directly
+AGENT_CATALOG = AgentListResponse(
+    agents=[
+        AgentInfo(
+            role=AgentRole.RESEARCHER,
+            name="Research Agent",
+            description="Specializes in web research and information gathering",
+            capabilities=[
+                "Web search and information retrieval",
+                "Data analysis and summarization",
+                "Source verification and fact-checking"
+            ]
+        ),
+        AgentInfo(
+            role=AgentRole.WRITER,
+            name="Content Writer",
+            description="Creates high-quality written content from research findings",
+            capabilities=[
+                "Content creation and copywriting",
+                "Adapting tone and style for different audiences",
+                "Structuring information logically"
+            ]
+        ),
+        AgentInfo(
+            role=AgentRole.ANALYST,
+            name="Quality Analyst",
+            description="Reviews and improves content quality and accuracy",
+            capabilities=[
+                "Content review and quality assessment",
+                "Fact-checking and accuracy verification",
+                "Professional editing and refinement"
+            ]
+        )
+    ]
+)
+
+AGENT_LIST_RESPONSE = AGENT_CATALOG.model_dump_json()
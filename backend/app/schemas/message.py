@@ -4,7 +4,7 @@ Pydantic schemas for message-related API operations.
 
 from datetime import datetime
 from typing import List
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
 
 from app.models.message import AgentRole
 
@@ -76,4 +76,24 @@ class MessageListResponse(BaseModel):
                 "total": 8,
                 "task_id": "123e4567-e89b-12d3-a456-426614174000"
             }
-        }
\ No newline at end of file
+        }
+
+
+class MessageStatsResponse(BaseModel):
+    """Schema for task message count summary."""
+    task_id: str
+    total: int = Field(..., description="Number of messages in the conversation")
+    empty: int = Field(..., description="Number of messages with blank content")
+    
+    class Config:
+        schema_extra = {
+            "example": {
+                "task_id": "123e4567-e89b-12d3-a456-426614174000",
+                "total": 8,
+                "empty": 0
+            }
+        }
+
+
+# Bulk validator for message rows, built once like TASK_LIST_ADAPTER
+MESSAGE_LIST_ADAPTER = TypeAdapter(List[MessageResponse])
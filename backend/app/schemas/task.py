@@ -4,7 +4,7 @@ Pydantic schemas for task-related API operations.
 
 from datetime import datetime
 from typing import Optional, List
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
 
 from app.models.task import TaskStatus
 
@@ -58,6 +58,20 @@ class TaskResponse(TaskBase):
         }
 
 
+class TaskStatusResponse(BaseModel):
+    """Schema for the lightweight task status response."""
+    id: str
+    status: TaskStatus
+    
+    class Config:
+        schema_extra = {
+            "example": {
+                "id": "123e4567-e89b-12d3-a456-426614174000",
+                "status": "in_progress"
+            }
+        }
+
+
 class TaskListResponse(BaseModel):
     """Schema for paginated task list response."""
     tasks: List[TaskResponse]
@@ -83,4 +97,9 @@ class TaskListResponse(BaseModel):
                 "page": 1,
                 "size": 10
             }
-        }
\ No newline at end of file
+        }
+
+
+# Built once at import so list endpoints can validate ORM rows in bulk
+# without FastAPI's extra dump/re-validate pass over the response model
+TASK_LIST_ADAPTER = TypeAdapter(List[TaskResponse])
@@ -4,12 +4,11 @@ Task processing service for managing AI agent workflows.
 
 import logging
 import asyncio
-from typing import Optional
-from sqlalchemy.orm import Session
+from typing import FrozenSet, Optional
 
 from app.models.task import Task, TaskStatus
 from app.agents.orchestrator import get_orchestrator
-from app.database import SessionLocal
+from app.database import AsyncSessionLocal
 
 logger = logging.getLogger(__name__)
 
@@ -36,9 +35,8 @@ class TaskProcessingService:
         
         try:
             # Get task from database
-            db = SessionLocal()
-            try:
-                task = db.query(Task).filter(Task.id == task_id).first()
+            async with AsyncSessionLocal() as db:
+                task = await db.get(Task, task_id)
                 
                 if not task:
                     logger.error(f"Task {task_id} not found")
@@ -55,9 +53,6 @@ class TaskProcessingService:
                 
                 logger.info(f"Task {task_id} processing completed")
                 
-            finally:
-                db.close()
-                
         except Exception as e:
             logger.error(f"Error processing task {task_id}: {str(e)}")
             
@@ -81,9 +76,9 @@ class TaskProcessingService:
         """Check if a task is currently being processed."""
         return task_id in self._processing_tasks
     
-    def get_active_tasks(self) -> list:
-        """Get list of currently processing task IDs."""
-        return list(self._processing_tasks)
+    def get_active_tasks(self) -> FrozenSet[str]:
+        """Get an immutable snapshot of currently processing task IDs."""
+        return frozenset(self._processing_tasks)
 
 
 # Global service instance
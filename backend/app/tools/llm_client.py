@@ -4,17 +4,34 @@ LLM client for agent interactions using OpenAI.
 
 import logging
 from typing import Optional, List, Dict, Any
+import httpx
 from openai import AsyncOpenAI
 from app.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Connection pool shared by all agents; sized for researcher/writer/analyst
+# calls running concurrently across several tasks
+HTTP_LIMITS = httpx.Limits(
+    max_connections=200,
+    max_keepalive_connections=100,
+    keepalive_expiry=30.0
+)
+HTTP_TIMEOUT = httpx.Timeout(60.0, connect=5.0)
+
 
 class LLMClient:
     """Async OpenAI client wrapper for agent LLM interactions."""
     
     def __init__(self):
-        self.client = AsyncOpenAI(api_key=settings.openai_api_key)
+        self.client = AsyncOpenAI(
+            api_key=settings.openai_api_key,
+            http_client=httpx.AsyncClient(
+                limits=HTTP_LIMITS,
+                timeout=HTTP_TIMEOUT,
+                http2=True  # Multiplex concurrent agent calls over one connection
+            )
+        )
         self.default_model = "gpt-4o-mini"  # Use gpt-4o-mini as requested
     
     async def generate(
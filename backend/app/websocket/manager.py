@@ -2,18 +2,53 @@
 WebSocket connection manager using Socket.IO for real-time communication.
 """
 
+import asyncio
 import logging
+import orjson
 import socketio
-from typing import Dict, Set
+from typing import Dict, List, Set
 from datetime import datetime
 
 from app.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Coalescing window for streamed agent messages
+BATCH_WINDOW_SECONDS = 0.015
+
+
+def _now_iso() -> str:
+    """Current UTC time as an ISO 8601 string with millisecond precision."""
+    return datetime.utcnow().isoformat(timespec="milliseconds") + "Z"
+
+
+class _OrjsonPacketJSON:
+    """
+    orjson adapter for Socket.IO packet encoding.
+    
+    Socket.IO passes stdlib ``json`` keyword arguments and expects ``str``
+    output, so these are dropped and orjson's bytes decoded.
+    """
+    
+    @staticmethod
+    def dumps(obj, *args, **kwargs) -> str:
+        return orjson.dumps(obj).decode()
+    
+    @staticmethod
+    def loads(s, *args, **kwargs):
+        return orjson.loads(s)
+
+
+# Share rooms across workers through Redis when configured
+client_manager = (
+    socketio.AsyncRedisManager(settings.redis_url) if settings.redis_url else None
+)
+
 # Create Socket.IO server
 sio = socketio.AsyncServer(
     async_mode="asgi",
+    client_manager=client_manager,
+    json=_OrjsonPacketJSON,
     cors_allowed_origins=settings.allowed_origins,
     ping_interval=settings.ws_ping_interval,
     ping_timeout=settings.ws_ping_timeout,
@@ -23,61 +58,101 @@ sio = socketio.AsyncServer(
 
 
 class ConnectionManager:
-    """Manages WebSocket connections and task subscriptions."""
+    """
+    Manages WebSocket connections and task subscriptions.
+    
+    Each task is a Socket.IO room keyed by task ID. With a Redis message
+    queue configured, broadcasts reach subscribers on every worker.
+    """
     
     def __init__(self):
         # Track active connections by session ID
         self.active_connections: Dict[str, str] = {}  # session_id -> task_id
-        # Track task subscribers
-        self.task_subscribers: Dict[str, Set[str]] = {}  # task_id -> set of session_ids
+        # Agent messages waiting for the next batched emit
+        self._pending: Dict[str, List[dict]] = {}  # task_id -> list of payloads
+        self._flush_handles: Dict[str, asyncio.TimerHandle] = {}  # task_id -> scheduled flush
+        # Timed flushes still running; the loop only keeps weak references to tasks
+        self._flush_tasks: Set[asyncio.Task] = set()
     
     async def connect(self, sid: str, task_id: str = None):
         """Register a new connection."""
         self.active_connections[sid] = task_id
         
         if task_id:
-            if task_id not in self.task_subscribers:
-                self.task_subscribers[task_id] = set()
-            self.task_subscribers[task_id].add(sid)
+            await sio.enter_room(sid, task_id)
             
         logger.info(f"Client {sid} connected" + (f" to task {task_id}" if task_id else ""))
     
     async def disconnect(self, sid: str):
         """Handle client disconnection."""
-        task_id = self.active_connections.get(sid)
+        # Socket.IO removes the session from its rooms on disconnect
+        self.active_connections.pop(sid, None)
         
-        if task_id and task_id in self.task_subscribers:
-            self.task_subscribers[task_id].discard(sid)
-            if not self.task_subscribers[task_id]:
-                del self.task_subscribers[task_id]
-        
-        if sid in self.active_connections:
-            del self.active_connections[sid]
-            
         logger.info(f"Client {sid} disconnected")
     
     async def subscribe_to_task(self, sid: str, task_id: str):
         """Subscribe a client to task updates."""
-        # Remove from previous task if any
+        # Leave previous task room if any
         old_task_id = self.active_connections.get(sid)
-        if old_task_id and old_task_id in self.task_subscribers:
-            self.task_subscribers[old_task_id].discard(sid)
+        if old_task_id and old_task_id != task_id:
+            await sio.leave_room(sid, old_task_id)
         
         # Subscribe to new task
         self.active_connections[sid] = task_id
-        if task_id not in self.task_subscribers:
-            self.task_subscribers[task_id] = set()
-        self.task_subscribers[task_id].add(sid)
+        await sio.enter_room(sid, task_id)
         
         logger.info(f"Client {sid} subscribed to task {task_id}")
     
     async def broadcast_to_task(self, task_id: str, event: str, data: dict):
         """Broadcast an event to all subscribers of a task."""
-        if task_id in self.task_subscribers:
-            subscribers = list(self.task_subscribers[task_id])
-            if subscribers:
-                logger.info(f"Broadcasting {event} to {len(subscribers)} clients for task {task_id}")
-                await sio.emit(event, data, room=None, skip_sid=None, to=subscribers)
+        data.setdefault("timestamp", _now_iso())
+        
+        # Deliver any batched messages first so clients see events in order
+        await self.flush_now(task_id)
+        await self._emit_to_task(task_id, event, data)
+    
+    async def queue_to_task(self, task_id: str, data: dict):
+        """
+        Queue an agent message for the task's next batched broadcast.
+        
+        Messages are coalesced over a short window and delivered as a single
+        ``agent_message_batch`` event instead of one packet per message.
+        """
+        data.setdefault("timestamp", _now_iso())
+        self._pending.setdefault(task_id, []).append(data)
+        
+        if task_id not in self._flush_handles:
+            loop = asyncio.get_running_loop()
+            self._flush_handles[task_id] = loop.call_later(
+                BATCH_WINDOW_SECONDS, self._start_flush, task_id
+            )
+    
+    def _start_flush(self, task_id: str):
+        """Start a timed flush, holding a reference until it finishes."""
+        task = asyncio.ensure_future(self.flush_now(task_id))
+        self._flush_tasks.add(task)
+        task.add_done_callback(self._flush_tasks.discard)
+    
+    async def flush_now(self, task_id: str):
+        """Emit all pending agent messages for a task as one batch without waiting for the window."""
+        handle = self._flush_handles.pop(task_id, None)
+        if handle:
+            handle.cancel()
+        
+        messages = self._pending.pop(task_id, None)
+        if messages:
+            try:
+                await self._emit_to_task(task_id, "agent_message_batch", {
+                    "task_id": task_id,
+                    "messages": messages
+                })
+            except Exception as e:
+                logger.error(f"Failed to emit {len(messages)} agent messages for task {task_id}: {str(e)}")
+    
+    async def _emit_to_task(self, task_id: str, event: str, data: dict):
+        """Emit an event to the task's room."""
+        logger.info(f"Broadcasting {event} for task {task_id}")
+        await sio.emit(event, data, room=task_id)
     
     async def send_to_client(self, sid: str, event: str, data: dict):
         """Send an event to a specific client."""
@@ -132,26 +207,22 @@ async def human_intervention(sid, data):
         return
     
     # Store human intervention as a message
-    from app.database import SessionLocal
+    from app.database import AsyncSessionLocal
     from app.models.message import Message, AgentRole
     
-    db = SessionLocal()
-    try:
+    async with AsyncSessionLocal() as db:
         human_message = Message(
             task_id=task_id,
             agent_role=AgentRole.HUMAN,
             content=message
         )
         db.add(human_message)
-        db.commit()
-    finally:
-        db.close()
+        await db.commit()
     
     # Broadcast intervention to all task subscribers
     await connection_manager.broadcast_to_task(task_id, "human_intervention", {
         "task_id": task_id,
-        "message": message,
-        "timestamp": str(datetime.utcnow())
+        "message": message
     })
 
 
@@ -160,39 +231,48 @@ async def notify_task_started(task_id: str, task_data: dict):
     """Notify clients that a task has started."""
     await connection_manager.broadcast_to_task(task_id, "task_started", {
         "task_id": task_id,
-        "task": task_data,
-        "timestamp": str(datetime.utcnow())
+        "task": task_data
+    })
+
+
+async def notify_task_status(task_id: str, status: str):
+    """Notify clients that a task's status has changed."""
+    await connection_manager.broadcast_to_task(task_id, "task_status", {
+        "task_id": task_id,
+        "status": status
     })
 
 
+def agent_message_payload(agent_role: str, content: str) -> dict:
+    """Build the event payload for an agent message."""
+    return {
+        "agent_role": agent_role,
+        "content": content,
+        "message": content  # Field read by the frontend
+    }
+
+
 async def notify_agent_message(task_id: str, message_data: dict):
-    """Notify clients of a new agent message."""
-    # Support both dict and individual parameters
-    if isinstance(message_data, dict):
-        # Ensure 'message' field exists for frontend compatibility
-        if 'content' in message_data and 'message' not in message_data:
-            message_data['message'] = message_data['content']
-        
-        await connection_manager.broadcast_to_task(task_id, "agent_message", {
-            "task_id": task_id,
-            **message_data
-        })
-    else:
-        # Legacy support
-        await connection_manager.broadcast_to_task(task_id, "agent_message", {
-            "task_id": task_id,
-            "agent_role": message_data,
-            "message": "",
-            "timestamp": str(datetime.utcnow())
-        })
+    """
+    Notify clients of a new agent message.
+    
+    ``message_data`` comes from ``agent_message_payload`` and is queued as-is
+    for the next batched broadcast.
+    """
+    message_data.setdefault("task_id", task_id)
+    await connection_manager.queue_to_task(task_id, message_data)
+
+
+async def flush_agent_messages(task_id: str):
+    """Deliver a task's batched agent messages immediately, e.g. at the end of an agent turn."""
+    await connection_manager.flush_now(task_id)
 
 
 async def notify_task_completed(task_id: str, deliverable: str):
     """Notify clients that a task has been completed."""
     await connection_manager.broadcast_to_task(task_id, "task_completed", {
         "task_id": task_id,
-        "deliverable": deliverable,
-        "timestamp": str(datetime.utcnow())
+        "deliverable": deliverable
     })
 
 
@@ -200,6 +280,5 @@ async def notify_error(task_id: str, error_message: str):
     """Notify clients of an error during task processing."""
     await connection_manager.broadcast_to_task(task_id, "error", {
         "task_id": task_id,
-        "error": error_message,
-        "timestamp": str(datetime.utcnow())
+        "error": error_message
     })
\ No newline at end of file
@@ -1,6 +1,9 @@
 #!/usr/bin/env python3
 """
 Initialize the database by creating all required tables.
+
+Existing tables are left untouched. Set DROP_EXISTING=1 to drop and
+recreate all tables (destroys all task and message history).
 """
 
 import sys
@@ -18,25 +21,18 @@ def init_database():
     print("Creating database tables...")
     print(f"Database URL: {engine.url}")
     
-    # Drop all tables first (for clean slate)
-    Base.metadata.drop_all(bind=engine)
-    print("Dropped existing tables (if any)")
+    # Only drop tables when explicitly requested
+    if os.environ.get("DROP_EXISTING") == "1":
+        Base.metadata.drop_all(bind=engine)
+        print("Dropped existing tables (DROP_EXISTING=1)")
     
-    # Create all tables
-    Base.metadata.create_all(bind=engine)
+    # Create missing tables; existing ones are skipped
+    Base.metadata.create_all(bind=engine, checkfirst=True)
     
     print("Database tables created successfully!")
-    print("\nTables created:")
+    print("\nTables:")
     for table in Base.metadata.tables:
         print(f"  - {table}")
-    
-    # Verify tables exist
-    from sqlalchemy import inspect
-    inspector = inspect(engine)
-    existing_tables = inspector.get_table_names()
-    print("\nVerified tables in database:")
-    for table in existing_tables:
-        print(f"  ✓ {table}")
 
 if __name__ == "__main__":
-    init_database()
\ No newline at end of file
+    init_database()
@@ -5,17 +5,20 @@ Main application entry point with OpenAPI documentation, CORS, and WebSocket sup
 """
 
 import logging
+import os
 from contextlib import asynccontextmanager
-from typing import AsyncGenerator
+from pathlib import Path
+from typing import Any, AsyncGenerator, Dict, Optional
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import RedirectResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse, RedirectResponse
 import socketio
 
 from app.config import settings
-from app.database import create_tables
-from app.api.routes import tasks, messages, health
+from app.database import async_engine, create_tables
+from app.api.routes import tasks, messages, agents, health
 from app.websocket.manager import sio
 
 
@@ -39,41 +42,13 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     
     # Shutdown
     logger.info("Shutting down AI Digital Workforce Backend...")
+    await async_engine.dispose()
 
 
 # Create FastAPI application with comprehensive OpenAPI documentation
 app = FastAPI(
     title="AI Digital Workforce API",
-    description="""
-    ## AI Digital Workforce Backend API
-    
-    A comprehensive API for managing multi-agent AI collaboration workflows.
-    
-    ### Features
-    - **Multi-Agent System**: Researcher, Writer, and Analyst agents
-    - **Real-time Communication**: WebSocket support for live agent interactions
-    - **Task Management**: Create, track, and export AI-generated deliverables
-    - **Web Search Integration**: Tavily API for research capabilities
-    - **Export Functionality**: Generate PDF and Markdown outputs
-    
-    ### Agent Workflow
-    1. **Researcher** gathers information from web sources
-    2. **Writer** creates content based on research findings  
-    3. **Analyst** reviews and refines the output
-    4. **Human** can intervene at any stage for guidance
-    
-    ### Getting Started
-    1. Create a new task via `/api/tasks/`
-    2. Connect to WebSocket at `/socket.io/` for real-time updates
-    3. Watch agents collaborate and provide input as needed
-    4. Export final deliverables when complete
-    
-    ### WebSocket Events
-    - `task_started`: Task begins processing
-    - `agent_message`: Agent sends a message
-    - `task_completed`: Task finished with deliverable
-    - `error`: Error occurred during processing
-    """,
+    description="",  # Loaded from description.md on first /openapi.json request
     version="0.1.0",
     terms_of_service="https://github.com/automate/ai-digital-workforce/blob/main/LICENSE",
     contact={
@@ -94,6 +69,10 @@ app = FastAPI(
             "name": "messages", 
             "description": "Message operations - retrieve agent conversations and chat history",
         },
+        {
+            "name": "agents",
+            "description": "Agent catalog - roles and capabilities of the collaborating agents",
+        },
         {
             "name": "health",
             "description": "System health and status monitoring",
@@ -104,6 +83,7 @@ app = FastAPI(
         },
     ],
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
     docs_url="/docs",
     redoc_url="/redoc",
     swagger_ui_parameters={
@@ -116,19 +96,41 @@ app = FastAPI(
     swagger_ui_standalone_preset=True,
 )
 
+_DESCRIPTION_PATH = Path(__file__).with_name("description.md")
+_DESCRIPTION: Optional[str] = None
+
+
+def custom_openapi() -> Dict[str, Any]:
+    """Build the OpenAPI schema, reading the API description on first use."""
+    global _DESCRIPTION
+    if app.openapi_schema is None:
+        if _DESCRIPTION is None:
+            _DESCRIPTION = _DESCRIPTION_PATH.read_text(encoding="utf-8")
+        app.description = _DESCRIPTION
+    return FastAPI.openapi(app)
+
+
+app.openapi = custom_openapi
+
 # Add CORS middleware
 app.add_middleware(
     CORSMiddleware,
     allow_origins=settings.allowed_origins,
     allow_credentials=True,
-    allow_methods=["GET", "POST", "PUT", "DELETE"],
-    allow_headers=["*"],
+    allow_methods=("GET", "POST", "PUT", "DELETE"),
+    allow_headers=("Content-Type", "Authorization", "X-Requested-With"),
+    max_age=86400,  # Let browsers cache preflight responses for a day
 )
 
+# Compress large responses such as full task conversations; level 5 keeps
+# most of the size reduction at a fraction of the default level 9 CPU cost
+app.add_middleware(GZipMiddleware, minimum_size=1000, compresslevel=5)
+
 # Include API routes
 app.include_router(health.router, prefix="/api", tags=["health"])
 app.include_router(tasks.router, prefix="/api/tasks", tags=["tasks"])
 app.include_router(messages.router, prefix="/api/messages", tags=["messages"])
+app.include_router(agents.router, prefix="/api/agents", tags=["agents"])
 
 # Mount Socket.IO application
 socket_app = socketio.ASGIApp(sio, app)
@@ -157,5 +159,12 @@ if __name__ == "__main__":
         host=settings.api_host,
         port=settings.api_port,
         reload=settings.debug,
+        # Socket.IO broadcasts only reach every worker through the Redis queue
+        workers=max(2, os.cpu_count() or 1) if settings.redis_url and not settings.debug else 1,
+        # uvloop and httptools are used when installed (not on Windows); both
+        # event loops enable TCP_NODELAY so small Socket.IO frames aren't delayed
+        loop="auto",
+        http="auto",
+        backlog=2048,  # Absorb reconnect bursts from many Socket.IO clients
         log_level=settings.log_level.lower()
     )
\ No newline at end of file
@@ -21,12 +21,12 @@ python -m pip install --upgrade pip
 
 echo Installing dependencies...
 pip install fastapi uvicorn[standard] pydantic pydantic-settings
-pip install sqlalchemy alembic
-pip install python-socketio python-multipart
+pip install sqlalchemy alembic aiosqlite asyncmy
+pip install python-socketio python-multipart orjson
 pip install openai langchain langgraph tavily-python
-pip install python-dotenv httpx aiofiles jinja2
+pip install python-dotenv httpx[http2] aiofiles jinja2
 pip install passlib python-jose[cryptography]
-pip install pytest pytest-asyncio black flake8 mypy
+pip install pytest pytest-asyncio aiohttp black flake8 mypy
 
 echo Creating requirements.txt...
 pip freeze > requirements.txt
@@ -48,12 +48,12 @@ python -m pip install --upgrade pip
 # Install dependencies
 echo "📚 Installing dependencies..."
 python -m pip install fastapi uvicorn[standard] pydantic pydantic-settings
-python -m pip install sqlalchemy alembic
-python -m pip install python-socketio python-multipart
+python -m pip install sqlalchemy alembic aiosqlite asyncmy
+python -m pip install python-socketio python-multipart orjson
 python -m pip install openai langchain langgraph tavily-python
-python -m pip install python-dotenv httpx aiofiles jinja2
+python -m pip install python-dotenv httpx[http2] aiofiles jinja2
 python -m pip install passlib python-jose[cryptography]
-python -m pip install pytest pytest-asyncio black flake8 mypy
+python -m pip install pytest pytest-asyncio aiohttp black flake8 mypy
 
 # Create requirements.txt from installed packages
 echo "📝 Creating requirements.txt..."
@@ -4,12 +4,17 @@ Test that all agent messages are being saved to the database.
 """
 
 import asyncio
-import requests
-import time
+import httpx
 import json
+from collections import Counter
+
+from testing._tasks import wait_for_task_status
 
 BASE_URL = "http://localhost:8000"
 
+# Shared client so every request reuses the same connection
+client = httpx.Client(base_url=BASE_URL, http2=True, timeout=30.0)
+
 def create_test_task():
     """Create a test task."""
     task_data = {
@@ -17,7 +22,7 @@ def create_test_task():
         "description": "Quick test to verify all agent messages are saved to database"
     }
     
-    response = requests.post(f"{BASE_URL}/api/tasks/", json=task_data)
+    response = client.post("/api/tasks/", json=task_data)
     if response.status_code == 201:
         task = response.json()
         print(f"✅ Task created: {task['id']}")
@@ -26,31 +31,25 @@ def create_test_task():
         print(f"❌ Failed to create task: {response.text}")
         return None
 
+async def fetch_status(task_id):
+    """Fetch the task's status endpoint without blocking the Socket.IO client."""
+    response = await asyncio.to_thread(client.get, f"/api/tasks/{task_id}/status")
+    return response.status_code, response.content
+
 def wait_for_completion(task_id, max_wait=60):
-    """Wait for task to complete."""
+    """Wait for the task to finish."""
     print("Waiting for task to complete...")
-    for i in range(max_wait):
-        response = requests.get(f"{BASE_URL}/api/tasks/{task_id}")
-        if response.status_code == 200:
-            task = response.json()
-            status = task['status']
-            if status == 'completed':
-                print(f"✅ Task completed")
-                return True
-            elif status == 'failed':
-                print(f"❌ Task failed")
-                return False
-            else:
-                if i % 5 == 0:
-                    print(f"  Status: {status} ({i}s elapsed)")
-        time.sleep(1)
-    
-    print(f"⏱️ Task did not complete within {max_wait} seconds")
+    status = asyncio.run(wait_for_task_status(task_id, fetch_status, max_wait, BASE_URL))
+    if status == 'completed':
+        print(f"✅ Task completed")
+        return True
+    if status == 'failed':
+        print(f"❌ Task failed")
     return False
 
 def check_messages(task_id):
     """Check messages for the task."""
-    response = requests.get(f"{BASE_URL}/api/messages/task/{task_id}")
+    response = client.get(f"/api/messages/task/{task_id}")
     if response.status_code == 200:
         data = response.json()
         messages = data['messages']
@@ -58,20 +57,15 @@ def check_messages(task_id):
         print(f"\n📬 Total messages saved: {len(messages)}")
         print("\nMessage breakdown by agent:")
         
-        agent_counts = {}
-        for msg in messages:
-            agent = msg.get('agent_role', 'unknown')
-            agent_counts[agent] = agent_counts.get(agent, 0) + 1
-            
-        for agent, count in agent_counts.items():
+        agent_counts = Counter(msg.get('agent_role', 'unknown') for msg in messages)
+        for agent, count in agent_counts.most_common():
             print(f"  {agent}: {count} messages")
         
         print("\nMessage timeline:")
         for i, msg in enumerate(messages, 1):
             agent = msg.get('agent_role', 'unknown')
-            content_preview = msg.get('content', '')[:100]
-            if len(msg.get('content', '')) > 100:
-                content_preview += "..."
+            content = msg.get('content') or ''
+            content_preview = content[:100] + ("..." if len(content) > 100 else "")
             print(f"  {i}. [{agent}] {content_preview}")
         
         # Check for expected messages
@@ -91,18 +85,18 @@ def main():
     print("Testing Message Persistence")
     print("=" * 50)
     
-    # Create task
-    task_id = create_test_task()
-    if not task_id:
-        return
-    
-    # Wait for completion
-    if not wait_for_completion(task_id):
-        return
-    
-    # Check messages
-    time.sleep(2)  # Give a moment for final saves
-    check_messages(task_id)
+    with client:
+        # Create task
+        task_id = create_test_task()
+        if not task_id:
+            return
+        
+        # Wait for completion
+        if not wait_for_completion(task_id):
+            return
+        
+        # Check messages; every message is committed before the final status event
+        check_messages(task_id)
     
     print("\n" + "=" * 50)
     print("Test Complete")
@@ -14,40 +14,38 @@ import os
 BASE_URL = os.environ.get("API_URL", "http://localhost:8001")
 TIMEOUT = httpx.Timeout(30.0)
 
-async def test_health_check() -> bool:
+async def test_health_check(client: httpx.AsyncClient) -> bool:
     """Test the health check endpoint."""
     print("\n1. Testing Health Check...")
-    async with httpx.AsyncClient(timeout=TIMEOUT) as client:
-        try:
-            response = await client.get(f"{BASE_URL}/health")
-            if response.status_code == 200:
-                data = response.json()
-                print(f"   ✅ Health check passed: {data}")
-                return True
-            else:
-                print(f"   ❌ Health check failed: Status {response.status_code}")
-                return False
-        except Exception as e:
-            print(f"   ❌ Health check error: {e}")
+    try:
+        response = await client.get("/health")
+        if response.status_code == 200:
+            data = response.json()
+            print(f"   ✅ Health check passed: {data}")
+            return True
+        else:
+            print(f"   ❌ Health check failed: Status {response.status_code}")
             return False
+    except Exception as e:
+        print(f"   ❌ Health check error: {e}")
+        return False
 
-async def test_api_docs() -> bool:
+async def test_api_docs(client: httpx.AsyncClient) -> bool:
     """Test that API documentation is accessible."""
     print("\n2. Testing API Documentation...")
-    async with httpx.AsyncClient(timeout=TIMEOUT) as client:
-        try:
-            response = await client.get(f"{BASE_URL}/docs")
-            if response.status_code == 200:
-                print(f"   ✅ API docs available at {BASE_URL}/docs")
-                return True
-            else:
-                print(f"   ❌ API docs not accessible: Status {response.status_code}")
-                return False
-        except Exception as e:
-            print(f"   ❌ API docs error: {e}")
+    try:
+        response = await client.get("/docs")
+        if response.status_code == 200:
+            print(f"   ✅ API docs available at {BASE_URL}/docs")
+            return True
+        else:
+            print(f"   ❌ API docs not accessible: Status {response.status_code}")
             return False
+    except Exception as e:
+        print(f"   ❌ API docs error: {e}")
+        return False
 
-async def test_create_task() -> Dict[str, Any]:
+async def test_create_task(client: httpx.AsyncClient) -> Dict[str, Any]:
     """Test creating a new task."""
     print("\n3. Testing Task Creation...")
     task_data = {
@@ -55,77 +53,73 @@ async def test_create_task() -> Dict[str, Any]:
         "description": "Research and summarize the top 3 AI trends in 2025"
     }
     
-    async with httpx.AsyncClient(timeout=TIMEOUT) as client:
-        try:
-            response = await client.post(
-                f"{BASE_URL}/api/tasks/",
-                json=task_data
-            )
-            if response.status_code == 200:
-                data = response.json()
-                print(f"   ✅ Task created successfully: ID={data.get('id')}")
-                return data
-            else:
-                print(f"   ❌ Task creation failed: Status {response.status_code}")
-                print(f"      Response: {response.text}")
-                return {}
-        except Exception as e:
-            print(f"   ❌ Task creation error: {e}")
+    try:
+        response = await client.post(
+            "/api/tasks/",
+            json=task_data
+        )
+        if response.status_code == 200:
+            data = response.json()
+            print(f"   ✅ Task created successfully: ID={data.get('id')}")
+            return data
+        else:
+            print(f"   ❌ Task creation failed: Status {response.status_code}")
+            print(f"      Response: {response.text}")
             return {}
+    except Exception as e:
+        print(f"   ❌ Task creation error: {e}")
+        return {}
 
-async def test_get_tasks() -> bool:
+async def test_get_tasks(client: httpx.AsyncClient) -> bool:
     """Test retrieving task list."""
     print("\n4. Testing Get Tasks...")
-    async with httpx.AsyncClient(timeout=TIMEOUT) as client:
-        try:
-            response = await client.get(f"{BASE_URL}/api/tasks/")
-            if response.status_code == 200:
-                data = response.json()
-                print(f"   ✅ Retrieved {data.get('total', 0)} tasks")
-                if data.get('tasks'):
-                    print(f"      Sample task: {data['tasks'][0]['title']}")
-                return True
-            else:
-                print(f"   ❌ Get tasks failed: Status {response.status_code}")
-                return False
-        except Exception as e:
-            print(f"   ❌ Get tasks error: {e}")
+    try:
+        response = await client.get("/api/tasks/")
+        if response.status_code == 200:
+            data = response.json()
+            print(f"   ✅ Retrieved {data.get('total', 0)} tasks")
+            if data.get('tasks'):
+                print(f"      Sample task: {data['tasks'][0]['title']}")
+            return True
+        else:
+            print(f"   ❌ Get tasks failed: Status {response.status_code}")
             return False
+    except Exception as e:
+        print(f"   ❌ Get tasks error: {e}")
+        return False
 
-async def test_get_task_detail(task_id: str) -> bool:
+async def test_get_task_detail(client: httpx.AsyncClient, task_id: str) -> bool:
     """Test retrieving a specific task."""
     print(f"\n5. Testing Get Task Detail (ID: {task_id})...")
-    async with httpx.AsyncClient(timeout=TIMEOUT) as client:
-        try:
-            response = await client.get(f"{BASE_URL}/api/tasks/{task_id}")
-            if response.status_code == 200:
-                data = response.json()
-                print(f"   ✅ Task retrieved: {data.get('title')}")
-                print(f"      Status: {data.get('status')}")
-                return True
-            else:
-                print(f"   ❌ Get task detail failed: Status {response.status_code}")
-                return False
-        except Exception as e:
-            print(f"   ❌ Get task detail error: {e}")
+    try:
+        response = await client.get(f"/api/tasks/{task_id}")
+        if response.status_code == 200:
+            data = response.json()
+            print(f"   ✅ Task retrieved: {data.get('title')}")
+            print(f"      Status: {data.get('status')}")
+            return True
+        else:
+            print(f"   ❌ Get task detail failed: Status {response.status_code}")
             return False
+    except Exception as e:
+        print(f"   ❌ Get task detail error: {e}")
+        return False
 
-async def test_get_messages(task_id: str) -> bool:
+async def test_get_messages(client: httpx.AsyncClient, task_id: str) -> bool:
     """Test retrieving messages for a task."""
     print(f"\n6. Testing Get Messages (Task ID: {task_id})...")
-    async with httpx.AsyncClient(timeout=TIMEOUT) as client:
-        try:
-            response = await client.get(f"{BASE_URL}/api/messages/task/{task_id}")
-            if response.status_code == 200:
-                data = response.json()
-                print(f"   ✅ Retrieved {data.get('total', 0)} messages")
-                return True
-            else:
-                print(f"   ❌ Get messages failed: Status {response.status_code}")
-                return False
-        except Exception as e:
-            print(f"   ❌ Get messages error: {e}")
+    try:
+        response = await client.get(f"/api/messages/task/{task_id}")
+        if response.status_code == 200:
+            data = response.json()
+            print(f"   ✅ Retrieved {data.get('total', 0)} messages")
+            return True
+        else:
+            print(f"   ❌ Get messages failed: Status {response.status_code}")
             return False
+    except Exception as e:
+        print(f"   ❌ Get messages error: {e}")
+        return False
 
 async def test_websocket_connection() -> bool:
     """Test WebSocket connectivity."""
@@ -164,21 +158,20 @@ async def test_websocket_connection() -> bool:
         print("   ⚠️  python-socketio not installed, skipping WebSocket test")
         return False
 
-async def test_delete_task(task_id: str) -> bool:
+async def test_delete_task(client: httpx.AsyncClient, task_id: str) -> bool:
     """Test deleting a task."""
     print(f"\n8. Testing Delete Task (ID: {task_id})...")
-    async with httpx.AsyncClient(timeout=TIMEOUT) as client:
-        try:
-            response = await client.delete(f"{BASE_URL}/api/tasks/{task_id}")
-            if response.status_code == 200:
-                print(f"   ✅ Task deleted successfully")
-                return True
-            else:
-                print(f"   ❌ Delete task failed: Status {response.status_code}")
-                return False
-        except Exception as e:
-            print(f"   ❌ Delete task error: {e}")
+    try:
+        response = await client.delete(f"/api/tasks/{task_id}")
+        if response.status_code == 200:
+            print(f"   ✅ Task deleted successfully")
+            return True
+        else:
+            print(f"   ❌ Delete task failed: Status {response.status_code}")
             return False
+    except Exception as e:
+        print(f"   ❌ Delete task error: {e}")
+        return False
 
 async def main():
     """Run all API tests."""
@@ -199,24 +192,40 @@ async def main():
         "delete_task": False
     }
     
-    # Run tests
-    results["health_check"] = await test_health_check()
-    results["api_docs"] = await test_api_docs()
-    
-    # Create a test task
-    task_data = await test_create_task()
-    if task_data and task_data.get("id"):
-        results["create_task"] = True
-        task_id = task_data["id"]
-        
-        # Test other endpoints with the created task
-        results["get_tasks"] = await test_get_tasks()
-        results["get_task_detail"] = await test_get_task_detail(task_id)
-        results["get_messages"] = await test_get_messages(task_id)
-        results["websocket"] = await test_websocket_connection()
+    # Share one client so connections are pooled across all tests
+    async with httpx.AsyncClient(
+        base_url=BASE_URL, timeout=TIMEOUT, http2=True
+    ) as client:
+        # Independent checks run concurrently
+        (
+            results["health_check"],
+            results["api_docs"],
+            results["get_tasks"],
+        ) = await asyncio.gather(
+            test_health_check(client),
+            test_api_docs(client),
+            test_get_tasks(client),
+        )
         
-        # Clean up - delete the test task
-        results["delete_task"] = await test_delete_task(task_id)
+        # Create a test task
+        task_data = await test_create_task(client)
+        if task_data and task_data.get("id"):
+            results["create_task"] = True
+            task_id = task_data["id"]
+            
+            # Test other endpoints with the created task
+            (
+                results["get_task_detail"],
+                results["get_messages"],
+                results["websocket"],
+            ) = await asyncio.gather(
+                test_get_task_detail(client, task_id),
+                test_get_messages(client, task_id),
+                test_websocket_connection(),
+            )
+            
+            # Clean up - delete the test task
+            results["delete_task"] = await test_delete_task(client, task_id)
     
     # Print summary
     print("\n" + "=" * 60)
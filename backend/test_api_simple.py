@@ -8,10 +8,13 @@ import json
 
 BASE_URL = "http://localhost:8001"
 
+# Shared session so every request reuses the same keep-alive connection
+session = requests.Session()
+
 def test_health():
     """Test health endpoint."""
     print("Testing /health...")
-    response = requests.get(f"{BASE_URL}/health")
+    response = session.get(f"{BASE_URL}/health")
     print(f"  Status: {response.status_code}")
     print(f"  Response: {response.json()}")
     return response.status_code == 200
@@ -19,21 +22,24 @@ def test_health():
 def test_get_tasks():
     """Test getting tasks list."""
     print("\nTesting GET /api/tasks/...")
-    response = requests.get(f"{BASE_URL}/api/tasks/")
+    response = session.get(f"{BASE_URL}/api/tasks/")
     print(f"  Status: {response.status_code}")
     if response.status_code == 200:
         data = response.json()
         print(f"  Total tasks: {data.get('total', 0)}")
     return response.status_code == 200
 
+def test_api_docs():
+    """Test that the API docs are served."""
+    print("\nTesting /docs...")
+    response = session.get(f"{BASE_URL}/docs")
+    print(f"  Status: {response.status_code}")
+    return response.status_code == 200
+
 def test_create_task_direct():
     """Test creating a task via direct database insert (bypass agent processing)."""
     print("\nTesting task creation (checking if DB works)...")
     
-    # First, let's check if we can access the API docs
-    response = requests.get(f"{BASE_URL}/docs")
-    print(f"  API docs status: {response.status_code}")
-    
     # Try to create a simple task
     task_data = {
         "title": "Simple Test Task",
@@ -44,10 +50,9 @@ def test_create_task_direct():
     print(f"  Data: {task_data}")
     
     try:
-        response = requests.post(
+        response = session.post(
             f"{BASE_URL}/api/tasks/",
-            json=task_data,
-            headers={"Content-Type": "application/json"}
+            json=task_data
         )
         print(f"  Status: {response.status_code}")
         print(f"  Response: {response.text[:200]}")
@@ -66,6 +71,7 @@ def main():
     # Run tests
     results.append(("Health Check", test_health()))
     results.append(("Get Tasks", test_get_tasks()))
+    results.append(("API Docs", test_api_docs()))
     results.append(("Create Task", test_create_task_direct()))
     
     # Summary
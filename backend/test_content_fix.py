@@ -9,110 +9,108 @@ import json
 import sys
 from datetime import datetime
 
+from testing._tasks import wait_for_task_status
+
 BASE_URL = "http://localhost:8000"
 API_URL = f"{BASE_URL}/api"
 
-async def test_content_truncation():
+async def test_content_truncation(session: aiohttp.ClientSession):
     """Test that content writer agent doesn't truncate content."""
     print("\n=== Testing Content Truncation Fix ===")
     
-    async with aiohttp.ClientSession() as session:
-        # Create a task that should generate long content
-        task_data = {
-            "title": "Write a comprehensive guide on Pakistan's EV market",
-            "description": "Create a detailed 2000+ word article about Pakistan's electric vehicle market, covering government policies, local startups, challenges, opportunities, and future prospects. Include statistics and data."
-        }
-        
-        print(f"Creating task: {task_data['title']}")
-        async with session.post(f"{API_URL}/tasks/", json=task_data) as resp:
-            if resp.status != 201:
-                print(f"Failed to create task: {await resp.text()}")
-                return False
-            
-            task = await resp.json()
-            task_id = task["id"]
-            print(f"Task created with ID: {task_id}")
-            
-        # Wait for task to complete (max 60 seconds)
-        print("Waiting for task to complete...")
-        for i in range(60):
-            await asyncio.sleep(1)
-            async with session.get(f"{API_URL}/tasks/{task_id}") as resp:
-                task = await resp.json()
-                if task["status"] == "completed":
-                    break
-                if i % 5 == 0:
-                    print(f"  Status: {task['status']} ({i}s elapsed)")
-        
-        if task["status"] != "completed":
-            print(f"Task did not complete in time. Status: {task['status']}")
+    # Create a task that should generate long content
+    task_data = {
+        "title": "Write a comprehensive guide on Pakistan's EV market",
+        "description": "Create a detailed 2000+ word article about Pakistan's electric vehicle market, covering government policies, local startups, challenges, opportunities, and future prospects. Include statistics and data."
+    }
+    
+    print(f"Creating task: {task_data['title']}")
+    async with session.post(f"{API_URL}/tasks/", json=task_data) as resp:
+        if resp.status != 201:
+            print(f"Failed to create task: {await resp.text()}")
             return False
-            
-        # Check deliverable length
-        deliverable = task.get("deliverable", "")
-        word_count = len(deliverable.split())
-        char_count = len(deliverable)
         
-        print(f"\nDeliverable stats:")
-        print(f"  Character count: {char_count}")
-        print(f"  Word count: {word_count}")
-        print(f"  First 200 chars: {deliverable[:200]}...")
-        print(f"  Last 200 chars: ...{deliverable[-200:]}")
+        task = await resp.json()
+        task_id = task["id"]
+        print(f"Task created with ID: {task_id}")
         
-        # Check if content seems truncated
-        if char_count < 3000:
-            print("❌ Content appears truncated (less than 3000 characters)")
-            return False
+    async def fetch_status(task_id):
+        async with session.get(f"{API_URL}/tasks/{task_id}/status") as resp:
+            return resp.status, await resp.read()
+    
+    # Wait for the task to finish (max 60 seconds)
+    print("Waiting for task to complete...")
+    await wait_for_task_status(task_id, fetch_status, timeout=60, base_url=BASE_URL)
+    
+    async with session.get(f"{API_URL}/tasks/{task_id}") as resp:
+        task = await resp.json()
+    
+    if task["status"] != "completed":
+        print(f"Task did not complete in time. Status: {task['status']}")
+        return False
         
-        if deliverable.endswith("...") or deliverable.endswith(".."):
-            print("❌ Content appears truncated (ends with ellipsis)")
-            return False
-            
-        print("✅ Content appears complete!")
-        return True
+    # Check deliverable length
+    deliverable = task.get("deliverable", "")
+    word_count = len(deliverable.split())
+    char_count = len(deliverable)
+    
+    print(f"\nDeliverable stats:")
+    print(f"  Character count: {char_count}")
+    print(f"  Word count: {word_count}")
+    print(f"  First 200 chars: {deliverable[:200]}...")
+    print(f"  Last 200 chars: ...{deliverable[-200:]}")
+    
+    # Check if content seems truncated
+    if char_count < 3000:
+        print("❌ Content appears truncated (less than 3000 characters)")
+        return False
+    
+    if deliverable.endswith("...") or deliverable.endswith(".."):
+        print("❌ Content appears truncated (ends with ellipsis)")
+        return False
+        
+    print("✅ Content appears complete!")
+    return True
 
-async def test_empty_messages():
+async def test_empty_messages(session: aiohttp.ClientSession):
     """Test that empty messages don't appear when viewing tasks."""
     print("\n=== Testing Empty Messages Fix ===")
     
-    async with aiohttp.ClientSession() as session:
-        # Get existing tasks
-        async with session.get(f"{API_URL}/tasks/") as resp:
-            data = await resp.json()
-            tasks = data.get("tasks", [])
-            
-        if not tasks:
-            print("No existing tasks to test with")
-            return False
-            
-        # Check messages for each task
-        for task in tasks[:3]:  # Check first 3 tasks
-            task_id = task["id"]
-            print(f"\nChecking messages for task: {task['title']}")
-            
-            async with session.get(f"{API_URL}/messages/task/{task_id}") as resp:
-                if resp.status != 200:
-                    print(f"  Failed to get messages: {await resp.text()}")
-                    continue
-                    
-                data = await resp.json()
-                messages = data.get("messages", [])
+    # Get existing tasks
+    async with session.get(f"{API_URL}/tasks/") as resp:
+        data = await resp.json()
+        tasks = data.get("tasks", [])
+        
+    if not tasks:
+        print("No existing tasks to test with")
+        return False
+        
+    # Check messages for each task
+    for task in tasks[:3]:  # Check first 3 tasks
+        task_id = task["id"]
+        print(f"\nChecking messages for task: {task['title']}")
+        
+        async with session.get(f"{API_URL}/messages/task/{task_id}/stats") as resp:
+            if resp.status != 200:
+                print(f"  Failed to get message stats: {await resp.text()}")
+                continue
                 
-                empty_count = 0
+            stats = await resp.json()
+            
+            if stats["empty"] == 0:
+                print(f"  ✅ No empty messages found ({stats['total']} total messages)")
+            else:
+                # Fetch the conversation only on failure to report which agents sent them
+                async with session.get(f"{API_URL}/messages/task/{task_id}") as messages_resp:
+                    messages = (await messages_resp.json()).get("messages", [])
                 for msg in messages:
-                    content = msg.get("content", "")
-                    if not content or not content.strip():
-                        empty_count += 1
+                    if not (msg.get("content") or "").strip():
                         print(f"  ❌ Found empty message from {msg.get('agent_role', 'unknown')}")
+                print(f"  ❌ Found {stats['empty']} empty messages out of {stats['total']} total")
+                return False
                 
-                if empty_count == 0:
-                    print(f"  ✅ No empty messages found ({len(messages)} total messages)")
-                else:
-                    print(f"  ❌ Found {empty_count} empty messages out of {len(messages)} total")
-                    return False
-                    
-        print("\n✅ No empty messages found in any tasks!")
-        return True
+    print("\n✅ No empty messages found in any tasks!")
+    return True
 
 async def main():
     """Run all tests."""
@@ -121,13 +119,16 @@ async def main():
     
     results = []
     
-    # Test content truncation fix
-    result1 = await test_content_truncation()
-    results.append(("Content Truncation Fix", result1))
-    
-    # Test empty messages fix
-    result2 = await test_empty_messages()
-    results.append(("Empty Messages Fix", result2))
+    # One keep-alive connection pool shared by all tests
+    connector = aiohttp.TCPConnector(limit=20, keepalive_timeout=30)
+    async with aiohttp.ClientSession(connector=connector) as session:
+        # Test content truncation fix
+        result1 = await test_content_truncation(session)
+        results.append(("Content Truncation Fix", result1))
+        
+        # Test empty messages fix
+        result2 = await test_empty_messages(session)
+        results.append(("Empty Messages Fix", result2))
     
     # Summary
     print("\n" + "="*50)
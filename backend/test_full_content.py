@@ -3,93 +3,115 @@
 Test that full content is being displayed in messages.
 """
 
-import requests
-import json
-import time
+import asyncio
+from collections import defaultdict
+import logging
+import orjson
+
+from testing._http import async_client
+from testing._tasks import wait_for_task_status
 
 BASE_URL = "http://localhost:8000"
 
-def test_full_content():
+# Set up logging
+logging.basicConfig(level=logging.INFO, format="%(message)s")
+logging.getLogger("httpx").setLevel(logging.WARNING)  # Skip per-request lines
+
+async def test_full_content():
     """Create a task and check if full content is saved."""
     
-    # Create a simple test task
-    task_data = {
-        "title": "Test Full Content Display",
-        "description": "Create a short article about Python programming to test if full content is displayed"
-    }
-    
-    print("Creating test task...")
-    response = requests.post(f"{BASE_URL}/api/tasks/", json=task_data)
-    if response.status_code != 201:
-        print(f"Failed to create task: {response.text}")
-        return
-    
-    task = response.json()
-    task_id = task["id"]
-    print(f"Task created: {task_id}")
-    
-    # Wait for completion
-    print("Waiting for task to complete...")
-    for i in range(60):
-        response = requests.get(f"{BASE_URL}/api/tasks/{task_id}")
-        if response.status_code == 200:
-            task = response.json()
-            if task["status"] == "completed":
-                print("Task completed!")
-                break
-            elif task["status"] == "failed":
-                print("Task failed!")
-                return
-        time.sleep(2)
-        if i % 3 == 0:
-            print(f"  Status: {task['status']} ({i*2}s elapsed)")
-    
-    # Get messages
-    print("\nFetching messages...")
-    response = requests.get(f"{BASE_URL}/api/messages/task/{task_id}")
-    if response.status_code != 200:
-        print(f"Failed to get messages: {response.text}")
-        return
+    async with async_client(BASE_URL) as client:
+        # Create a simple test task
+        task_data = {
+            "title": "Test Full Content Display",
+            "description": "Create a short article about Python programming to test if full content is displayed"
+        }
         
-    data = response.json()
-    messages = data["messages"]
-    
-    print(f"\nTotal messages: {len(messages)}")
-    print("-" * 50)
-    
-    # Check for content from each agent
-    writer_content = None
-    analyst_content = None
-    
-    for msg in messages:
-        agent = msg.get("agent_role", "unknown")
-        content = msg.get("content", "")
+        print("Creating test task...")
+        response = await client.post(
+            "/api/tasks/",
+            content=orjson.dumps(task_data),
+            headers={"Content-Type": "application/json"}
+        )
+        if response.status_code != 201:
+            print(f"Failed to create task: {response.text}")
+            return
         
-        if agent == "writer" and "**Full Content:**" in content:
-            writer_content = content
-            print(f"\n✅ Writer sent full content ({len(content)} chars)")
-            # Show first 200 chars
-            print(f"Preview: {content[:200]}...")
+        task = orjson.loads(response.content)
+        task_id = task["id"]
+        print(f"Task created: {task_id}")
+        
+        async def fetch_status(task_id):
+            response = await client.get(f"/api/tasks/{task_id}/status")
+            return response.status_code, response.content
+        
+        # Wait for completion
+        print("Waiting for task to complete...")
+        status = await wait_for_task_status(task_id, fetch_status, base_url=BASE_URL)
+        
+        if status == "completed":
+            print("Task completed!")
+        elif status == "failed":
+            print("Task failed!")
+            return
+        
+        # Get messages
+        print("\nFetching messages...")
+        response = await client.get(f"/api/messages/task/{task_id}")
+        if response.status_code != 200:
+            print(f"Failed to get messages: {response.text}")
+            return
             
-        elif agent == "analyst" and "**Refined Content:**" in content:
-            analyst_content = content
-            print(f"\n✅ Analyst sent refined content ({len(content)} chars)")
+        data = orjson.loads(response.content)
+        messages = data["messages"]
+        
+        print(f"\nTotal messages: {len(messages)}")
+        print("-" * 50)
+        
+        # Group contents by agent so only candidate messages are searched
+        by_role = defaultdict(list)
+        for msg in messages:
+            by_role[msg.get("agent_role", "unknown")].append(msg.get("content") or "")
+        
+        # Newest first: the final drafts come late in the conversation
+        writer_content = next(
+            (content for content in reversed(by_role["writer"]) if "**Full Content:**" in content),
+            None
+        )
+        analyst_content = next(
+            (content for content in reversed(by_role["analyst"]) if "**Refined Content:**" in content),
+            None
+        )
+        
+        if writer_content:
+            print(f"\n✅ Writer sent full content ({len(writer_content)} chars)")
             # Show first 200 chars
-            print(f"Preview: {content[:200]}...")
-    
-    # Verify
-    if writer_content and len(writer_content) > 500:
-        print("\n✅ Writer content is complete (not truncated)")
-    else:
-        print("\n❌ Writer content appears truncated or missing")
+            print(f"Preview: {writer_content[:200]}...")
         
-    if analyst_content and len(analyst_content) > 500:
-        print("✅ Analyst content is complete (not truncated)")
-    else:
-        print("❌ Analyst content appears truncated or missing")
-    
-    print("\n" + "=" * 50)
-    print("Test complete!")
+        if analyst_content:
+            print(f"\n✅ Analyst sent refined content ({len(analyst_content)} chars)")
+            # Show first 200 chars
+            print(f"Preview: {analyst_content[:200]}...")
+        
+        # Verify
+        if writer_content and len(writer_content) > 500:
+            print("\n✅ Writer content is complete (not truncated)")
+        else:
+            print("\n❌ Writer content appears truncated or missing")
+            
+        if analyst_content and len(analyst_content) > 500:
+            print("✅ Analyst content is complete (not truncated)")
+        else:
+            print("❌ Analyst content appears truncated or missing")
+        
+        print("\n" + "=" * 50)
+        print("Test complete!")
 
 if __name__ == "__main__":
-    test_full_content()
\ No newline at end of file
+    run = asyncio.run
+    try:
+        import uvloop  # Not available on Windows
+        run = uvloop.run
+    except ImportError:
+        pass
+    run(test_full_content())
\ No newline at end of file
@@ -3,71 +3,130 @@
 Test that markdown content is properly formatted in messages.
 """
 
-import requests
-import json
+import asyncio
+import socketio
+import orjson
+import re
 import time
 
+from testing._http import get_client
+from testing._tasks import wait_for_event
+
 BASE_URL = "http://localhost:8000"
 
+# Markdown element types and the pattern that marks each one
+_MARKDOWN_ELEMENTS = (
+    ("code", r"```|`"),
+    ("headings", r"^#{1,3} "),
+    ("bold", r"\*\*|__"),
+    ("lists", r"^(?:[-*] |\d+\. )"),
+    ("links", r"\[[^\]]*\]\("),
+)
+
+# One pass over a message finds every kind of markdown element it contains
+MARKDOWN_PATTERN = re.compile(
+    "|".join(f"(?P<{name}>{pattern})" for name, pattern in _MARKDOWN_ELEMENTS),
+    re.MULTILINE,
+)
+
+def classify_message(msg):
+    """Return the markdown element types in a substantial message, or None for short ones."""
+    content = msg.get("content", "")
+    if len(content) <= 100:
+        return None
+    return {match.lastgroup for match in MARKDOWN_PATTERN.finditer(content)}
+
+def has_substantive_message(messages, min_chars=100):
+    """Whether any message is long enough to check for markdown."""
+    return any(len(msg.get("content") or "") > min_chars for msg in messages)
+
+async def wait_for_substantive_message(client, task_id, timeout=30):
+    """Wait over Socket.IO for the first agent message long enough to check."""
+    async def check_now():
+        response = await asyncio.to_thread(client.get, f"/api/messages/task/{task_id}")
+        return (
+            response.status_code == 200
+            and has_substantive_message(orjson.loads(response.content)["messages"])
+        )
+    
+    received = await wait_for_event(
+        task_id,
+        "agent_message_batch",
+        lambda data: has_substantive_message(data.get("messages", [])),
+        check_now,
+        timeout,
+        BASE_URL,
+    )
+    if not received:
+        print(f"No substantive message within {timeout}s, checking what is there")
+
+def poll_for_substantive_messages(client, task_id, min_chars=100, timeout=30):
+    """Fetch the task's messages, backing off until one is long enough to check."""
+    deadline = time.monotonic() + timeout
+    delay = 0.3
+    while True:
+        response = client.get(f"/api/messages/task/{task_id}")
+        if response.status_code != 200:
+            print(f"Failed to get messages: {response.text}")
+            return None
+        
+        messages = orjson.loads(response.content)["messages"]
+        if has_substantive_message(messages, min_chars):
+            return messages
+        if time.monotonic() + delay >= deadline:
+            return messages
+        time.sleep(delay)
+        delay = min(delay * 1.6, 3.0)
+
 def create_markdown_test_task():
     """Create a task that will generate markdown content."""
     
+    client = get_client(BASE_URL)
+    
     task_data = {
         "title": "Markdown Rendering Test",
         "description": "Create a document with various markdown elements: headings, lists, bold text, code blocks, and links to test rendering"
     }
     
     print("Creating test task with markdown requirements...")
-    response = requests.post(f"{BASE_URL}/api/tasks/", json=task_data)
+    response = client.post(
+        "/api/tasks/",
+        content=orjson.dumps(task_data),
+        headers={"Content-Type": "application/json"}
+    )
     if response.status_code != 201:
         print(f"Failed to create task: {response.text}")
         return None
     
-    task = response.json()
+    task = orjson.loads(response.content)
     task_id = task["id"]
     print(f"✅ Task created: {task_id}")
     
-    # Give it time to generate some messages
+    # Wait until an agent posts a substantive message
     print("Waiting for agents to generate markdown content...")
-    time.sleep(10)
+    try:
+        asyncio.run(wait_for_substantive_message(client, task_id))
+    except socketio.exceptions.ConnectionError:
+        print("Socket.IO unavailable, polling instead")
     
     # Get messages
-    response = requests.get(f"{BASE_URL}/api/messages/task/{task_id}")
-    if response.status_code != 200:
-        print(f"Failed to get messages: {response.text}")
+    messages = poll_for_substantive_messages(client, task_id)
+    if messages is None:
         return None
-        
-    data = response.json()
-    messages = data["messages"]
     
     print(f"\n📝 Found {len(messages)} messages")
     print("-" * 50)
     
     # Check for markdown elements
-    markdown_elements = {
-        "headings": ["#", "##", "###"],
-        "bold": ["**", "__"],
-        "lists": ["- ", "* ", "1. "],
-        "code": ["```", "`"],
-        "links": ["[", "]("],
-    }
-    
     for msg in messages:
-        agent = msg.get("agent_role", "unknown")
-        content = msg.get("content", "")
-        
-        if len(content) > 100:  # Only check substantial messages
+        found_elements = classify_message(msg)
+        if found_elements is not None:  # Only substantial messages are checked
+            agent = msg.get("agent_role", "unknown")
+            content = msg.get("content", "")
             print(f"\n[{agent}] Message contains:")
-            found_elements = []
-            
-            for element_type, markers in markdown_elements.items():
-                for marker in markers:
-                    if marker in content:
-                        found_elements.append(element_type)
-                        break
             
             if found_elements:
-                print(f"  ✅ Markdown elements: {', '.join(set(found_elements))}")
+                print(f"  ✅ Markdown elements: {', '.join(found_elements)}")
                 # Show a snippet
                 snippet = content[:200].replace('\n', ' ')
                 print(f"  Preview: {snippet}...")
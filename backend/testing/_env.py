@@ -0,0 +1,23 @@
+"""
+Environment checks shared by the standalone test scripts.
+"""
+
+from functools import lru_cache
+
+from app.config import settings
+
+
+@lru_cache(maxsize=1)
+def openai_key_configured() -> bool:
+    """Whether a real OpenAI API key replaces the placeholder default."""
+    return not settings.openai_api_key.startswith("sk-test-key")
+
+
+def require_openai_key():
+    """Exit with setup instructions when no OpenAI API key is configured."""
+    if not openai_key_configured():
+        raise SystemExit(
+            "\n⚠️  WARNING: OpenAI API key is not set!\n"
+            "Please set your OpenAI API key in the .env file or environment variables.\n"
+            "Export OPENAI_API_KEY=your-actual-key"
+        )
@@ -0,0 +1,42 @@
+"""
+HTTP clients shared by the standalone test scripts.
+"""
+
+import atexit
+from typing import Optional
+
+import httpx
+
+DEFAULT_BASE_URL = "http://localhost:8000"
+HTTP_LIMITS = httpx.Limits(max_connections=16, max_keepalive_connections=16)
+HTTP_TIMEOUT = httpx.Timeout(30.0)
+
+_client: Optional[httpx.Client] = None
+
+
+def get_client(base_url: str = DEFAULT_BASE_URL) -> httpx.Client:
+    """
+    Get the process-wide HTTP client, creating it on first use.
+    
+    Every script run in the same process shares its connection pool. The
+    client is closed at interpreter exit.
+    """
+    global _client
+    if _client is None:
+        _client = httpx.Client(
+            base_url=base_url, http2=True, limits=HTTP_LIMITS, timeout=HTTP_TIMEOUT
+        )
+        atexit.register(_client.close)
+    return _client
+
+
+def async_client(base_url: str = DEFAULT_BASE_URL) -> httpx.AsyncClient:
+    """
+    Create an async HTTP client with the shared connection settings.
+    
+    Async clients are bound to the event loop they run on, so each
+    ``asyncio.run`` gets its own; use it as an async context manager.
+    """
+    return httpx.AsyncClient(
+        base_url=base_url, http2=True, limits=HTTP_LIMITS, timeout=HTTP_TIMEOUT
+    )
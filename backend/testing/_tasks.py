@@ -0,0 +1,134 @@
+"""
+Task event helpers shared by the standalone test scripts.
+"""
+
+import asyncio
+import logging
+import random
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+import orjson
+import socketio
+
+from testing._http import DEFAULT_BASE_URL
+
+FINAL_STATUSES = ("completed", "failed")
+
+# Fetches ``/api/tasks/{task_id}/status``, returning the HTTP status code and raw body
+StatusFetcher = Callable[[str], Awaitable[Tuple[int, bytes]]]
+
+logger = logging.getLogger(__name__)
+
+
+async def wait_for_event(
+    task_id: str,
+    event: str,
+    matches: Callable[[Dict[str, Any]], bool],
+    check_now: Callable[[], Awaitable[bool]],
+    timeout: float,
+    base_url: str = DEFAULT_BASE_URL,
+) -> bool:
+    """
+    Wait over Socket.IO for a task event that satisfies ``matches``.
+    
+    ``check_now`` runs once after subscribing, since the event may have gone
+    out before the client joined the task's room.
+    
+    Returns:
+        Whether a matching event (or the catch-up check) arrived in time
+    
+    Raises:
+        socketio.exceptions.ConnectionError: If the server can't be reached
+    """
+    sio = socketio.AsyncClient()
+    received = asyncio.Event()
+    
+    @sio.on(event)
+    async def on_event(data):
+        if matches(data):
+            received.set()
+    
+    await sio.connect(base_url, auth={"task_id": task_id})
+    try:
+        if await check_now():
+            return True
+        await asyncio.wait_for(received.wait(), timeout=timeout)
+        return True
+    except asyncio.TimeoutError:
+        return False
+    finally:
+        await sio.disconnect()
+
+
+async def _read_status(task_id: str, fetch_status: StatusFetcher) -> Optional[str]:
+    """Get the task's status, or None when the request failed."""
+    status_code, body = await fetch_status(task_id)
+    return orjson.loads(body)["status"] if status_code == 200 else None
+
+
+async def poll_for_task_status(
+    task_id: str, fetch_status: StatusFetcher, timeout: float = 120
+) -> Optional[str]:
+    """
+    Poll the task with jittered exponential backoff until it finishes.
+    
+    Returns:
+        The final status, or the last status seen if the timeout ran out
+    """
+    start = time.monotonic()
+    deadline = start + timeout
+    delay = 0.25
+    last_log = start
+    status = None
+    while time.monotonic() < deadline:
+        status = await _read_status(task_id, fetch_status)
+        if status in FINAL_STATUSES:
+            return status
+        await asyncio.sleep(delay * random.uniform(0.8, 1.2))
+        delay = min(delay * 1.5, 5.0)
+        now = time.monotonic()
+        if now - last_log > 6:
+            logger.info("  Status: %s (%.0fs elapsed)", status, now - start)
+            last_log = now
+    return status
+
+
+async def wait_for_task_status(
+    task_id: str,
+    fetch_status: StatusFetcher,
+    timeout: float = 120,
+    base_url: str = DEFAULT_BASE_URL,
+) -> Optional[str]:
+    """
+    Wait for the task to finish, via its ``task_status`` events.
+    
+    Falls back to polling the status endpoint when Socket.IO is unavailable.
+    
+    Returns:
+        "completed" or "failed", or None if the task didn't finish in time
+    """
+    outcome = {"status": None}
+    
+    def is_final(data):
+        if data.get("status") in FINAL_STATUSES:
+            outcome["status"] = data["status"]
+            return True
+        return False
+    
+    async def check_now():
+        status = await _read_status(task_id, fetch_status)
+        return is_final({"status": status})
+    
+    try:
+        finished = await wait_for_event(
+            task_id, "task_status", is_final, check_now, timeout, base_url
+        )
+    except socketio.exceptions.ConnectionError:
+        print("  Socket.IO unavailable, polling instead")
+        status = await poll_for_task_status(task_id, fetch_status, timeout)
+        return status if status in FINAL_STATUSES else None
+    
+    if not finished:
+        print(f"  Task did not finish within {timeout}s")
+    return outcome["status"]
@@ -46,7 +46,7 @@ export const ChatWindow: React.FC<ChatWindowProps> = ({ taskId, initialMessages
         // Only add non-empty messages
         if (messageContent.trim()) {
           const newMessage: Message = {
-            id: Date.now().toString(),
+            id: `${Date.now()}-${Math.random().toString(36).slice(2)}`,
             task_id: data.task_id,
             agent_role: data.agent_role,
             content: messageContent,
@@ -41,6 +41,13 @@ class SocketService {
         this.emit(event, data);
       });
     });
+
+    // Agent messages arrive coalesced; fan them out as individual events
+    this.socket.on('agent_message_batch', (data) => {
+      data.messages.forEach((message: any) => {
+        this.emit('agent_message', message);
+      });
+    });
   }
 
   disconnect(): void {